@@ -74,21 +74,31 @@ class RTTGraph:
             self.timestamps.append(timestamp)
             
             if len(self.rtt_data) > self.max_points:
-                self.rtt_data = self.rtt_data[-self.max_points:]
-                self.timestamps = self.timestamps[-self.max_points:]
+                # Trim in place rather than rebuilding both lists as slices
+                del self.rtt_data[:-self.max_points]
+                del self.timestamps[:-self.max_points]
             
             # Update line data
             self.line.set_data(self.timestamps, self.rtt_data)
             
             # Adjust axes limits
             if self.rtt_data:
-                self.ax.set_xlim(min(self.timestamps), max(self.timestamps))
+                # Timestamps are appended in order, so the ends are the limits
+                self.ax.set_xlim(self.timestamps[0], self.timestamps[-1])
                 self.ax.set_ylim(0, max(max(self.rtt_data) * 1.1, 10))  # Dynamic y-limit with min 10ms
             
             # Redraw in Tkinter main thread if not already scheduled
             self.canvas.draw_idle()  # Use draw_idle for smoother updates
         except Exception as e:
             logging.error(f"Plot update error: {e}")
+    
+    def clear(self):
+        """Reset plotted data, reusing the existing line artist"""
+        self.rtt_data.clear()
+        self.timestamps.clear()
+        self.line.set_data([], [])
+        self.ax.relim()
+        self.canvas.draw_idle()
 
 class StatsDisplay:
     """Advanced statistics display"""
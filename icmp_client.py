@@ -7,30 +7,54 @@ import time
 from datetime import datetime
 import logging
 import threading
-from scapy.all import sr1, IP, ICMP, conf
 import os
 import platform
 import subprocess
 import socket
 import re
+import shutil
 try:
     import ctypes
     from ctypes import wintypes
 except Exception:
     ctypes = None
 
+# Windows ICMP API structures, defined once at import rather than per probe
+if ctypes is not None:
+    class IP_OPTION_INFORMATION(ctypes.Structure):
+        _fields_ = [
+            ("Ttl", ctypes.c_ubyte),
+            ("Tos", ctypes.c_ubyte),
+            ("Flags", ctypes.c_ubyte),
+            ("OptionsSize", ctypes.c_ubyte),
+            ("OptionsData", ctypes.c_void_p),
+        ]
+
+    class ICMP_ECHO_REPLY(ctypes.Structure):
+        _fields_ = [
+            ("Address", wintypes.DWORD),
+            ("Status", wintypes.DWORD),
+            ("RoundTripTime", wintypes.DWORD),
+            ("DataSize", wintypes.WORD),
+            ("Reserved", wintypes.WORD),
+            ("Data", ctypes.c_void_p),
+            ("Options", IP_OPTION_INFORMATION),
+        ]
+
+_ICMP_PAYLOAD = b'0123456789abcdef'  # 16 bytes payload
+
+# RTT in ping output, e.g. Windows "time=23ms" / "time<1ms", Linux "time=23.4 ms"
+_RTT_RE = re.compile(r"time[=<]\s*([\d\.]+)\s*ms", re.IGNORECASE)
+
 class ICMPPinger:
     def __init__(self, timeout=10.0):
         self.timeout = timeout  # Increased to 10s for slower networks
         self.running = False
         self.results = []
         self.stop_event = threading.Event()
-        
-        # Configure Scapy quietly; do NOT force pcap — it breaks if Npcap isn't installed
-        try:
-            conf.verb = 0
-        except Exception:
-            pass
+        self._ping_exe = shutil.which("ping")  # resolve once; None if not on PATH
+        self._win_api = None  # (iphlpapi, ws2_32) once prototypes are declared
+        self._scapy = None    # (sr1, IP, ICMP) after first use, False if unavailable
         
         logging.info("ICMP Pinger initialized with timeout %.1f seconds", self.timeout)
 
@@ -43,11 +67,22 @@ class ICMPPinger:
         except Exception:
             return False
 
-    # +++ helper: Windows ICMP API (works without admin)
-    def _ping_windows_icmp(self, host, timeout_ms):
-        if os.name != 'nt' or ctypes is None:
-            return (0.0, False)
-        try:
+    # +++ helper: import Scapy on first use (slow import, unused on the Windows API path)
+    def _load_scapy(self):
+        if self._scapy is None:
+            try:
+                from scapy.all import sr1, IP, ICMP, conf
+                # Configure Scapy quietly; do NOT force pcap — it breaks if Npcap isn't installed
+                conf.verb = 0
+                self._scapy = (sr1, IP, ICMP)
+            except Exception as e:
+                logging.debug("Scapy unavailable: %s", e)
+                self._scapy = False
+        return self._scapy
+
+    # +++ helper: load Windows ICMP API and declare prototypes once
+    def _load_windows_icmp_api(self):
+        if self._win_api is None:
             iphlpapi = ctypes.windll.iphlpapi
             ws2_32 = ctypes.windll.ws2_32
 
@@ -58,26 +93,6 @@ class ICMPPinger:
 
                 iphlpapi.IcmpCreateFile.restype = ctypes.c_void_p
 
-                class IP_OPTION_INFORMATION(ctypes.Structure):
-                    _fields_ = [
-                        ("Ttl", ctypes.c_ubyte),
-                        ("Tos", ctypes.c_ubyte),
-                        ("Flags", ctypes.c_ubyte),
-                        ("OptionsSize", ctypes.c_ubyte),
-                        ("OptionsData", ctypes.c_void_p),
-                    ]
-
-                class ICMP_ECHO_REPLY(ctypes.Structure):
-                    _fields_ = [
-                        ("Address", wintypes.DWORD),
-                        ("Status", wintypes.DWORD),
-                        ("RoundTripTime", wintypes.DWORD),
-                        ("DataSize", wintypes.WORD),
-                        ("Reserved", wintypes.WORD),
-                        ("Data", ctypes.c_void_p),
-                        ("Options", IP_OPTION_INFORMATION),
-                    ]
-
                 iphlpapi.IcmpSendEcho.argtypes = [
                     ctypes.c_void_p,         # IcmpHandle
                     wintypes.DWORD,          # DestinationAddress
@@ -95,6 +110,15 @@ class ICMPPinger:
             except Exception:
                 # If prototypes fail, continue with best effort
                 pass
+            self._win_api = (iphlpapi, ws2_32)
+        return self._win_api
+
+    # +++ helper: Windows ICMP API (works without admin)
+    def _ping_windows_icmp(self, host, timeout_ms):
+        if os.name != 'nt' or ctypes is None:
+            return (0.0, False)
+        try:
+            iphlpapi, ws2_32 = self._load_windows_icmp_api()
 
             # Resolve once
             try:
@@ -113,7 +137,7 @@ class ICMPPinger:
                 logging.debug("Windows ICMP: IcmpCreateFile failed")
                 return (0.0, False)
 
-            data = b'0123456789abcdef'  # 16 bytes payload
+            data = _ICMP_PAYLOAD
             reply_size = ctypes.sizeof(ICMP_ECHO_REPLY) + len(data) + 8
             reply_buf = ctypes.create_string_buffer(reply_size)
 
@@ -147,21 +171,31 @@ class ICMPPinger:
             logging.debug("Windows ICMP exception: %s", e)
             return (0.0, False)
 
+    # +++ helper: resolve the target once per run instead of per probe
+    def _resolve(self, host):
+        try:
+            return socket.gethostbyname(host)
+        except Exception:
+            logging.debug("DNS resolution failed for %s", host)
+            return host  # let each probe path report the failure
+
     # +++ helper: subprocess ping (cross-platform fallback)
     def _ping_subprocess(self, host, timeout_ms):
+        if not self._ping_exe:
+            return (0.0, False)
         try:
             if platform.system().lower().startswith('win'):
-                cmd = ["ping", "-n", "1", "-w", str(int(timeout_ms)), host]
+                cmd = [self._ping_exe, "-n", "1", "-w", str(int(timeout_ms)), host]
             else:
                 tsec = max(1, int(round(timeout_ms / 1000.0)))
-                cmd = ["ping", "-c", "1", "-W", str(tsec), host]
+                cmd = [self._ping_exe, "-c", "1", "-W", str(tsec), host]
             out = subprocess.run(
                 cmd, capture_output=True, text=True,
                 timeout=max(1, int(timeout_ms/1000) + 2)
             )
             text = out.stdout + out.stderr
             if out.returncode == 0:
-                m = re.search(r"time[=<]\s*([\d\.]+)\s*ms", text, re.IGNORECASE)
+                m = _RTT_RE.search(text)
                 if m:
                     return (float(m.group(1)), True)
                 return (0.0, True)  # success but couldn't parse RTT
@@ -169,51 +203,60 @@ class ICMPPinger:
         except Exception:
             return (0.0, False)
 
+    def _probe(self, target, use_windows_icmp):
+        """Send one ICMP Echo Request to an already-resolved target; returns (rtt, success)"""
+        rtt = 0.0
+        success = False
+        try:
+            if use_windows_icmp:
+                # Try Windows API first; if it fails, fallback to subprocess
+                rtt, success = self._ping_windows_icmp(target, int(self.timeout * 1000))
+                if not success:
+                    rtt, success = self._ping_subprocess(target, int(self.timeout * 1000))
+                    if not success:
+                        logging.debug("Subprocess ping failed")
+            else:
+                # Try Scapy first (likely admin)
+                try:
+                    scapy = self._load_scapy()
+                    if not scapy:
+                        raise ImportError("scapy not available")
+                    sr1, IP, ICMP = scapy
+                    packet = IP(dst=target) / ICMP(type=8, code=0)
+                    start_time = time.perf_counter()
+                    response = sr1(packet, timeout=self.timeout, verbose=False)
+                    end_time = time.perf_counter()
+                    if response is not None and response.haslayer(ICMP) and response.getlayer(ICMP).type == 0:
+                        rtt = (end_time - start_time) * 1000.0
+                        success = True
+                except PermissionError:
+                    success = False
+                except Exception:
+                    success = False
+
+                if not success:
+                    rtt, success = self._ping_subprocess(target, int(self.timeout * 1000))
+        except Exception as e:
+            logging.error("Ping failed: %s", e)
+            rtt, success = 0.0, False
+        return (rtt, success)
+
     def ping(self, host, count=4, interval=1.0):
         """Send ICMP Echo Requests to a host and return results"""
         self.results = []
         use_windows_icmp = (os.name == 'nt' and not self._is_admin_windows())
+        target = self._resolve(host)
 
         for i in range(count):
             if self.stop_event.is_set():
                 break
 
-            rtt = 0.0
-            success = False
-            try:
-                if use_windows_icmp:
-                    # Try Windows API first; if it fails, fallback to subprocess
-                    rtt, success = self._ping_windows_icmp(host, int(self.timeout * 1000))
-                    if not success:
-                        rtt, success = self._ping_subprocess(host, int(self.timeout * 1000))
-                        if not success:
-                            logging.debug("Subprocess ping failed")
-                else:
-                    # Try Scapy first (likely admin)
-                    try:
-                        packet = IP(dst=host) / ICMP(type=8, code=0)
-                        start_time = time.monotonic()
-                        response = sr1(packet, timeout=self.timeout, verbose=False)
-                        end_time = time.monotonic()
-                        if response is not None and response.haslayer(ICMP) and response.getlayer(ICMP).type == 0:
-                            rtt = (end_time - start_time) * 1000.0
-                            success = True
-                    except PermissionError:
-                        success = False
-                    except Exception:
-                        success = False
-
-                    if not success:
-                        rtt, success = self._ping_subprocess(host, int(self.timeout * 1000))
-            except Exception as e:
-                logging.error("Ping failed: %s", e)
-                rtt, success = 0.0, False
-
+            rtt, success = self._probe(target, use_windows_icmp)
             self.results.append((rtt, success))
             logging.info("Ping %d to %s: RTT=%.2fms, Success=%s", i+1, host, rtt, success)
 
             if i < count - 1 and not self.stop_event.is_set():
-                time.sleep(max(0.0, interval))
+                self.stop_event.wait(max(0.0, interval))
 
         return self.results
 
@@ -225,19 +268,22 @@ class ICMPPinger:
         def ping_thread():
             try:
                 self.results = []
+                use_windows_icmp = (os.name == 'nt' and not self._is_admin_windows())
+                target = self._resolve(host)
                 # Stream per-ping results to GUI
                 for i in range(count):
                     if self.stop_event.is_set():
                         break
 
-                    # Reuse core logic for one probe
-                    single = self.ping(host, count=1, interval=0.0)
+                    rtt, success = self._probe(target, use_windows_icmp)
+                    self.results.append((rtt, success))
+                    logging.info("Ping %d to %s: RTT=%.2fms, Success=%s", i+1, host, rtt, success)
                     # Callback expects a list of (rtt, success)
-                    if self.running and callback and single:
-                        callback(single)
+                    if self.running and callback:
+                        callback([(rtt, success)])
 
                     if i < count - 1 and not self.stop_event.is_set():
-                        time.sleep(max(0.0, interval))
+                        self.stop_event.wait(max(0.0, interval))
             except Exception as e:
                 logging.error("Ping thread error: %s", e)
                 if callback:
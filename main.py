@@ -15,6 +15,12 @@ import csv
 import platform
 import subprocess
 import socket
+import shutil
+import re
+from functools import lru_cache
+
+# RTT in ping output, e.g. Windows "time=23ms" / "time<1ms", Linux "time=23.4 ms"
+_RTT_RE = re.compile(r"time[=<]\s*([\d\.]+)\s*ms", re.IGNORECASE)
 
 # Fallbacks for external modules to make this file self-contained
 try:
@@ -52,27 +58,34 @@ except Exception:
             self.results = []
 
         def add_results(self, results):
-            self.results = results[:]  # overwrite with current series
+            self.results.extend(results)  # append only the new batch
 
         def get_raw_rtts(self):
             return [rtt for rtt, ok in self.results if ok]
 
         def get_summary(self):
             total = len(self.results)
-            successes = sum(1 for _, ok in self.results if ok)
-            rtts = self.get_raw_rtts()
-            if rtts:
-                mn = min(rtts)
-                mx = max(rtts)
-                avg = sum(rtts) / len(rtts)
-                # jitter: mean absolute delta between consecutive RTTs
-                if len(rtts) > 1:
-                    deltas = [abs(rtts[i] - rtts[i-1]) for i in range(1, len(rtts))]
-                    jitter = sum(deltas) / len(deltas)
+            # single pass: count, min/max, sum and consecutive deltas together
+            successes = 0
+            mn = mx = rtt_sum = delta_sum = 0.0
+            prev = None
+            for rtt, ok in self.results:
+                if not ok:
+                    continue
+                if prev is None:
+                    mn = mx = rtt
                 else:
-                    jitter = 0.0
-            else:
-                mn = mx = avg = jitter = 0.0
+                    if rtt < mn:
+                        mn = rtt
+                    if rtt > mx:
+                        mx = rtt
+                    delta_sum += abs(rtt - prev)
+                rtt_sum += rtt
+                successes += 1
+                prev = rtt
+            avg = rtt_sum / successes if successes else 0.0
+            # jitter: mean absolute delta between consecutive RTTs
+            jitter = delta_sum / (successes - 1) if successes > 1 else 0.0
             loss = ((total - successes) / total * 100.0) if total else 0.0
             return {
                 "total_pings": total,
@@ -84,12 +97,43 @@ except Exception:
                 "packet_loss": loss,
             }
 
+    # ---- Windows ICMP API structures (defined once, not per probe) ----
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        class IP_OPTION_INFORMATION(ctypes.Structure):
+            _fields_ = [
+                ("Ttl", ctypes.c_ubyte),
+                ("Tos", ctypes.c_ubyte),
+                ("Flags", ctypes.c_ubyte),
+                ("OptionsSize", ctypes.c_ubyte),
+                ("OptionsData", ctypes.c_void_p),
+            ]
+
+        class ICMP_ECHO_REPLY(ctypes.Structure):
+            _fields_ = [
+                ("Address", wintypes.DWORD),
+                ("Status", wintypes.DWORD),
+                ("RoundTripTime", wintypes.DWORD),
+                ("DataSize", wintypes.WORD),
+                ("Reserved", wintypes.WORD),
+                ("Data", ctypes.c_void_p),
+                ("Options", IP_OPTION_INFORMATION),
+            ]
+    except Exception:
+        ctypes = None
+
+    _ICMP_PAYLOAD = b'0123456789abcdef'  # 16 bytes payload
+
     # ---- Minimal ICMPPinger using scapy ----
     class ICMPPinger:
         def __init__(self, timeout=2.0):
             self.timeout = timeout
             self._stop = threading.Event()
             self._thread = None
+            self._ping_exe = shutil.which("ping")  # resolve once; None if not on PATH
+            self._win_api = None  # (iphlpapi, ws2_32) after first Windows API probe
 
         def stop(self):
             self._stop.set()
@@ -107,14 +151,20 @@ except Exception:
             """Prefer platform-native ICMP on Windows (no admin), else Scapy, else subprocess ping."""
             # Try Scapy first if not Windows without admin
             use_windows_icmp = (os.name == 'nt' and not self._is_admin_windows())
+            # Resolve hostname once to avoid repeated DNS lookups
+            try:
+                dst = socket.gethostbyname(host)
+            except Exception:
+                dst = host
+
             if use_windows_icmp:
                 # Windows ICMP API path (no admin needed)
                 for _ in range(count):
                     if self._stop.is_set():
                         break
-                    rtt_ms, success = self._ping_windows_icmp(host, int(self.timeout * 1000))
+                    rtt_ms, success = self._ping_windows_icmp(dst, int(self.timeout * 1000))
                     callback([(float(rtt_ms), bool(success))])
-                    time.sleep(max(0.0, interval))
+                    self._stop.wait(max(0.0, interval))
                 return
 
             # Attempt Scapy (may require admin)
@@ -133,12 +183,10 @@ except Exception:
                 success = False
                 if scapy_ok:
                     try:
-                        # Resolve hostname early to avoid repeated DNS lookups
-                        dst = socket.gethostbyname(host)
                         pkt = IP(dst=dst) / ICMP(seq=seq)
-                        t0 = time.monotonic()
+                        t0 = time.perf_counter()
                         reply = sr1(pkt, timeout=self.timeout)
-                        t1 = time.monotonic()
+                        t1 = time.perf_counter()
                         if reply is not None and reply.haslayer(ICMP) and reply.getlayer(ICMP).type == 0:
                             rtt_ms = (t1 - t0) * 1000.0
                             success = True
@@ -150,12 +198,12 @@ except Exception:
 
                 if not success:
                     # Final fallback: subprocess ping (cross-platform)
-                    rtt_sub, ok_sub = self._ping_subprocess(host, int(self.timeout * 1000))
+                    rtt_sub, ok_sub = self._ping_subprocess(dst, int(self.timeout * 1000))
                     if ok_sub:
                         rtt_ms, success = rtt_sub, True
 
                 callback([(rtt_ms, success)])
-                time.sleep(max(0.0, interval))
+                self._stop.wait(max(0.0, interval))
 
         def _is_admin_windows(self):
             if os.name != 'nt':
@@ -166,34 +214,16 @@ except Exception:
             except Exception:
                 return False
 
+        def _load_windows_icmp_api(self):
+            """Look up the IP Helper / Winsock DLLs once. Returns (iphlpapi, ws2_32)."""
+            if self._win_api is None:
+                self._win_api = (ctypes.windll.iphlpapi, ctypes.windll.ws2_32)
+            return self._win_api
+
         def _ping_windows_icmp(self, host, timeout_ms):
             """Use Windows IP Helper API (IcmpSendEcho). Returns (rtt_ms, success)."""
             try:
-                import ctypes
-                from ctypes import wintypes
-
-                iphlpapi = ctypes.windll.iphlpapi
-                ws2_32 = ctypes.windll.ws2_32
-
-                class IP_OPTION_INFORMATION(ctypes.Structure):
-                    _fields_ = [
-                        ("Ttl", ctypes.c_ubyte),
-                        ("Tos", ctypes.c_ubyte),
-                        ("Flags", ctypes.c_ubyte),
-                        ("OptionsSize", ctypes.c_ubyte),
-                        ("OptionsData", ctypes.c_void_p),
-                    ]
-
-                class ICMP_ECHO_REPLY(ctypes.Structure):
-                    _fields_ = [
-                        ("Address", wintypes.DWORD),
-                        ("Status", wintypes.DWORD),
-                        ("RoundTripTime", wintypes.DWORD),
-                        ("DataSize", wintypes.WORD),
-                        ("Reserved", wintypes.WORD),
-                        ("Data", ctypes.c_void_p),
-                        ("Options", IP_OPTION_INFORMATION),
-                    ]
+                iphlpapi, ws2_32 = self._load_windows_icmp_api()
 
                 # Resolve host
                 try:
@@ -209,7 +239,7 @@ except Exception:
                 if handle == ctypes.c_void_p(-1).value:
                     return (0.0, False)
 
-                data = b'0123456789abcdef'  # 16 bytes payload
+                data = _ICMP_PAYLOAD
                 reply_size = ctypes.sizeof(ICMP_ECHO_REPLY) + len(data) + 8
                 reply_buf = ctypes.create_string_buffer(reply_size)
 
@@ -238,21 +268,22 @@ except Exception:
 
         def _ping_subprocess(self, host, timeout_ms):
             """Portable subprocess ping fallback. Returns (rtt_ms, success)."""
+            if not self._ping_exe:
+                return (0.0, False)
             try:
                 if platform.system().lower().startswith('win'):
                     # -n 1 (one echo), -w timeout_ms
-                    cmd = ["ping", "-n", "1", "-w", str(int(timeout_ms)), host]
+                    cmd = [self._ping_exe, "-n", "1", "-w", str(int(timeout_ms)), host]
                 else:
                     # -c 1 (one echo), -W timeout (seconds)
                     tsec = max(1, int(round(timeout_ms / 1000.0)))
-                    cmd = ["ping", "-c", "1", "-W", str(tsec), host]
+                    cmd = [self._ping_exe, "-c", "1", "-W", str(tsec), host]
                 out = subprocess.run(cmd, capture_output=True, text=True, timeout=max(1, int(timeout_ms/1000)+2))
                 text = out.stdout + out.stderr
                 if out.returncode == 0:
                     # Parse RTT from output
                     # Windows: "time=23ms", Linux: "time=23.4 ms"
-                    import re
-                    m = re.search(r"time[=<]\s*([\d\.]+)\s*ms", text, re.IGNORECASE)
+                    m = _RTT_RE.search(text)
                     if m:
                         return (float(m.group(1)), True)
                     # Some Windows locales print "Tiempo="; fallback to success without RTT
@@ -329,6 +360,15 @@ except Exception:
             self.ax.autoscale_view()
             self.canvas.draw_idle()
 
+        def clear(self):
+            self.rtt_data = []
+            self.timestamps = []
+            if not getattr(self, "_enabled", False):
+                return
+            self.line.set_data([], [])
+            self.ax.relim()
+            self.canvas.draw_idle()
+
     # ---- Minimal StatsDisplay ----
     class StatsDisplay:
         def __init__(self, parent):
@@ -350,7 +390,26 @@ except Exception:
                 else:
                     self._labels[k].set(str(v))
 
+# Report analysis rules: (predicate, template) evaluated in order.
+# Predicates see threshold verdicts taken from the unrounded stats.
+_ANALYSIS_RULES = [
+    (lambda low_loss, high_jitter: low_loss, "- Low packet loss indicates a stable connection"),
+    (lambda low_loss, high_jitter: not low_loss, "- High packet loss ({loss:.1f}%) suggests network issues"),
+    (lambda low_loss, high_jitter: high_jitter, "- High jitter suggests network congestion"),
+    (lambda low_loss, high_jitter: not high_jitter, "- Low jitter indicates consistent latency"),
+    (lambda low_loss, high_jitter: True, "- Average RTT of {avg:.2f} ms reflects overall latency"),
+]
+
+
+@lru_cache(maxsize=32)
+def _analysis_text(low_loss, high_jitter, loss, avg):
+    """Build the report analysis lines (cached on verdicts and displayed values)"""
+    return "\n".join(template.format(loss=loss, avg=avg)
+                     for pred, template in _ANALYSIS_RULES if pred(low_loss, high_jitter))
+
 class ICMPPingerApp:
+    PULSE_FRAMES = ("🏓 Pinging... ⠋", "🏓 Pinging... ⏳", "🏓 Pinging... ⠙", "🏓 Pinging... ⏳")
+
     def __init__(self, root):
         self.root = root
         self.root.title("🔍 ICMP Pinger Lab - Advanced Network Diagnostics")
@@ -363,7 +422,9 @@ class ICMPPingerApp:
         self.stats = PingStatistics()
         self.is_pinging = False
         self.current_host = ""
+        self.ping_count = 0
         self.ping_results = []
+        self._pulse_frame = 0
         
         # Setup logging
         logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -469,6 +530,8 @@ class ICMPPingerApp:
         scrollbar = ttk.Scrollbar(log_container, orient=tk.VERTICAL,
                                  command=self.log_text.yview)
         self.log_text.configure(yscrollcommand=scrollbar.set)
+        self.log_text.tag_config("success", foreground=ModernTheme.SUCCESS_COLOR)
+        self.log_text.tag_config("error", foreground=ModernTheme.WARNING_COLOR)
         
         self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -561,8 +624,6 @@ class ICMPPingerApp:
                 self.stop_server_btn.config(state='normal')
                 self.server_status.config(text="🟢 Server: Running (Simulation Mode)",
                                         foreground=ModernTheme.SUCCESS_COLOR)
-                
-                threading.Thread(target=self.monitor_server, daemon=True).start()
             else:
                 messagebox.showerror("Error", "Server start failed. Admin privileges required for full functionality.")
                 
@@ -574,11 +635,6 @@ class ICMPPingerApp:
         self.server_log.insert(tk.END, f"[{timestamp}] 📈 Requests: {stats['requests']} | Bytes: {stats['bytes']}\n")
         self.server_log.see(tk.END)
 
-    def monitor_server(self):
-        """Monitor server statistics (no-op since callback handles updates)"""
-        while self.server and self.server.running:
-            time.sleep(1)  # Sync with simulation interval
-
     def setup_stats_tab(self):
         """Statistics display tab"""
         self.stats_display = StatsDisplay(self.stats_frame)
@@ -617,6 +673,7 @@ class ICMPPingerApp:
                 return
             
             self.current_host = host
+            self.ping_count = count
             self.is_pinging = True
             self.stats.clear()
             self.ping_results = []
@@ -625,6 +682,7 @@ class ICMPPingerApp:
             self.stop_btn.config(state='normal')
             self.status_var.set("🏓 Pinging... ⏳")
             
+            self._pulse_frame = 0
             self.pulse_status()
             self.pinger.start_ping_thread(host, count, interval, self.ping_callback)
             
@@ -636,11 +694,10 @@ class ICMPPingerApp:
     def pulse_status(self):
         """Pulse effect for 'Pinging...' status"""
         if self.is_pinging:
-            current = self.status_var.get()
-            if "⏳" in current:
-                self.status_var.set(f"🏓 Pinging... {'⠋' if time.time() % 1 < 0.5 else '⠙'}")
-            else:
-                self.status_var.set("🏓 Pinging... ⏳")
+            # Step through a fixed frame cycle; no clock read or Tk var read per tick
+            frames = self.PULSE_FRAMES
+            self.status_var.set(frames[self._pulse_frame % len(frames)])
+            self._pulse_frame += 1
             self.root.after(500, self.pulse_status)
     
     def ping_callback(self, results):
@@ -650,13 +707,14 @@ class ICMPPingerApp:
     def process_results(self, results):
         """Process and display ping results in real-time with fixed plotting"""
         self.ping_results.extend(results)
-        self.stats.add_results(self.ping_results)
+        self.stats.add_results(results)
 
+        # One clock read and format per batch; all results arrived together
+        now = datetime.now()
+        timestamp = now.strftime("%H:%M:%S")
         for i, (rtt, success) in enumerate(results):
             seq = len(self.ping_results) - len(results) + i
             status = "✅ SUCCESS" if success else "❌ TIMEOUT"
-            color = ModernTheme.SUCCESS_COLOR if success else ModernTheme.WARNING_COLOR
-            timestamp = datetime.now().strftime("%H:%M:%S")
 
             log_entry = f"[{timestamp}] {status} | Seq: {seq} | RTT: {rtt:.2f}ms\n"
             self.log_text.insert(tk.END, log_entry)
@@ -666,17 +724,14 @@ class ICMPPingerApp:
             end_idx = "end"
             if success:
                 self.log_text.tag_add("success", start_idx, end_idx)
-                self.root.after(0, lambda rtt=rtt, ts=datetime.now(): self.rtt_graph.update_plot(rtt, ts))
+                self.rtt_graph.update_plot(rtt, now)
             else:
                 self.log_text.tag_add("error", start_idx, end_idx)
-
-        self.log_text.tag_config("success", foreground=ModernTheme.SUCCESS_COLOR)
-        self.log_text.tag_config("error", foreground=ModernTheme.WARNING_COLOR)
         self.log_text.see(tk.END)
         
         self.update_stats_display()
         
-        if len(self.ping_results) >= int(self.count_var.get()):
+        if len(self.ping_results) >= self.ping_count:
             self.ping_finished()
     
     def ping_finished(self):
@@ -710,13 +765,16 @@ class ICMPPingerApp:
         self.stats_display.update_stats(stats)
         
         rtts = self.stats.get_raw_rtts()
+        lines = [
+            f"Target: {self.current_host}\n",
+            f"Total Pings: {stats['total_pings']}\n",
+            f"Successful: {stats['successful_pings']}\n\n",
+            "RTT Values (ms):\n",
+        ]
+        lines.extend(f"  {i+1}: {rtt:.2f}\n" for i, rtt in enumerate(rtts[-20:]))
+        # One Tk insert for the whole block instead of one per line
         self.data_text.delete(1.0, tk.END)
-        self.data_text.insert(tk.END, f"Target: {self.current_host}\n")
-        self.data_text.insert(tk.END, f"Total Pings: {stats['total_pings']}\n")
-        self.data_text.insert(tk.END, f"Successful: {stats['successful_pings']}\n\n")
-        self.data_text.insert(tk.END, "RTT Values (ms):\n")
-        for i, rtt in enumerate(rtts[-20:]):
-            self.data_text.insert(tk.END, f"  {i+1}: {rtt:.2f}\n")
+        self.data_text.insert(tk.END, "".join(lines))
     
     def clear_all(self):
         """Clear all data"""
@@ -724,11 +782,7 @@ class ICMPPingerApp:
         self.log_text.delete(1.0, tk.END)
         self.server_log.delete(1.0, tk.END)
         self.data_text.delete(1.0, tk.END)
-        self.rtt_graph.rtt_data = []
-        self.rtt_graph.timestamps = []
-        # +++ guard if matplotlib backend not available
-        if hasattr(self.rtt_graph, "canvas"):
-            self.rtt_graph.canvas.draw()
+        self.rtt_graph.clear()
         self.status_var.set("🗑️ All data cleared")
         self.update_stats_display()
     
@@ -771,19 +825,10 @@ class ICMPPingerApp:
             return
 
         stats = self.stats.get_summary()
-        analysis = []
-        if stats['packet_loss'] < 10:
-            analysis.append("- Low packet loss indicates a stable connection")
-        else:
-            analysis.append(f"- High packet loss ({stats['packet_loss']:.1f}%) suggests network issues")
-        if stats['jitter'] > 20:
-            analysis.append("- High jitter suggests network congestion")
-        else:
-            analysis.append("- Low jitter indicates consistent latency")
-        analysis.append(f"- Average RTT of {stats['avg']:.2f} ms reflects overall latency")
-
-        # FIX: proper newline join and clean timestamp line
-        analysis_text = "\n".join(analysis)
+        analysis_text = _analysis_text(stats['packet_loss'] < 10,
+                                       stats['jitter'] > 20,
+                                       round(stats['packet_loss'], 1),
+                                       round(stats['avg'], 2))
         report = f"""
 🔍 ICMP PINGER LAB - DIAGNOSTIC REPORT
 {'='*50}
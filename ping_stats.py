@@ -10,13 +10,14 @@ class PingStatistics:
     def __init__(self):
         self.results: List[Tuple[float, bool]] = []
         self.packet_loss = 0.0
+        self._successful = 0
     
     def add_results(self, results: List[Tuple[float, bool]]):
-        """Add ping results"""
+        """Add new ping results (incremental; loss covers all results so far)"""
         self.results.extend(results)
-        successful_pings = sum(1 for rtt, success in results if success)
-        total_pings = len(results)
-        self.packet_loss = ((total_pings - successful_pings) / total_pings * 100) if total_pings else 0
+        self._successful += sum(1 for rtt, success in results if success)
+        total_pings = len(self.results)
+        self.packet_loss = ((total_pings - self._successful) / total_pings * 100) if total_pings else 0
     
     def get_summary(self) -> dict:
         """Get comprehensive statistics"""
@@ -51,6 +52,7 @@ class PingStatistics:
         """Clear statistics"""
         self.results = []
         self.packet_loss = 0.0
+        self._successful = 0
     
     def get_raw_rtts(self) -> List[float]:
         """Get raw RTT values for plotting"""